@@ -9,12 +9,19 @@ setup(
     url="https://github.com/rishuSingh404/CodeCritic",
     packages=find_packages(),
     install_requires=[
-        "streamlit>=1.28.0",
-        "anthropic>=0.8.0",
-        "openai>=1.1.0",
-        "google-generativeai>=0.3.0",
+        "streamlit>=1.37.0,<2",
         "python-dotenv>=1.0.0",
         "pydantic>=2.4.2",
     ],
+    extras_require={
+        "anthropic": ["anthropic>=0.8.0"],
+        "openai": ["openai>=1.1.0"],
+        "gemini": ["google-generativeai>=0.3.0"],
+        "all": [
+            "anthropic>=0.8.0",
+            "openai>=1.1.0",
+            "google-generativeai>=0.3.0",
+        ],
+    },
     python_requires=">=3.10",
 )
@@ -3,20 +3,83 @@ Simplified Streamlit app for CodeCritic - No package dependencies
 """
 
 import streamlit as st
+import asyncio
+import html
+import math
 import os
 import time
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
-# Configure page
-st.set_page_config(
-    page_title="CodeCritic - AI Code Review",
-    page_icon="🔍",
-    layout="wide",
-    initial_sidebar_state="expanded"
+# Sidebar choices
+MODELS = (
+    "anthropic/claude-3-sonnet-20240229",
+    "anthropic/claude-3-haiku-20240307",
+    "gpt-4",
+    "gpt-3.5-turbo"
+)
+
+LANGUAGES = ("python", "javascript", "typescript", "java", "cpp", "c", "csharp", "php", "ruby", "go", "rust")
+
+
+def read_demo_delay() -> float:
+    """Seconds the mock analysis sleeps to imitate a real model call (0 disables it)"""
+    try:
+        delay = float(os.getenv("CODECRITIC_DEMO_DELAY", "0"))
+    except ValueError:
+        return 0.0
+    return delay if math.isfinite(delay) and delay > 0 else 0.0
+
+
+DEMO_DELAY = read_demo_delay()
+
+# Language-specific placeholders
+PLACEHOLDERS = {
+    "python": "def example_function():\n    # Your code here\n    return 'Hello, World!'",
+    "javascript": "function exampleFunction() {\n    // Your JavaScript code here\n    return 'Hello, World!';\n}",
+    "typescript": "function exampleFunction(): string {\n    // Your TypeScript code here\n    return 'Hello, World!';\n}",
+    "java": "public class Example {\n    public static void main(String[] args) {\n        // Your Java code here\n        System.out.println(\"Hello, World!\");\n    }\n}",
+    "cpp": "#include <iostream>\n\nint main() {\n    // Your C++ code here\n    std::cout << \"Hello, World!\" << std::endl;\n    return 0;\n}",
+    "c": "#include <stdio.h>\n\nint main() {\n    // Your C code here\n    printf(\"Hello, World!\\n\");\n    return 0;\n}",
+    "csharp": "using System;\n\nclass Program {\n    static void Main() {\n        // Your C# code here\n        Console.WriteLine(\"Hello, World!\");\n    }\n}",
+    "php": "<?php\n// Your PHP code here\nfunction exampleFunction() {\n    return 'Hello, World!';\n}\n?>",
+    "ruby": "# Your Ruby code here\ndef example_function\n  'Hello, World!'\nend",
+    "go": "package main\n\nimport \"fmt\"\n\nfunc main() {\n    // Your Go code here\n    fmt.Println(\"Hello, World!\")\n}",
+    "rust": "fn main() {\n    // Your Rust code here\n    println!(\"Hello, World!\");\n}"
+}
+
+# Severity indicator and card CSS class for feedback items
+SEVERITY_STYLES = {
+    "critical": ("🔴", "severity-critical"),
+    "high": ("🟠", "severity-high"),
+    "medium": ("🟡", "severity-medium"),
+    "low": ("🟢", "severity-low")
+}
+DEFAULT_SEVERITY_STYLE = ("⚪", "severity-medium")
+
+# Severity card for a single feedback item
+FEEDBACK_CARD_TEMPLATE = (
+    '<div class="{severity_class}" style="padding: 1rem; margin: 0.5rem 0; border-radius: 0.5rem;">'
+    '<strong>{severity_color} {message}</strong><br>'
+    '<small>Confidence: {confidence:.1%} | Severity: {severity}</small>'
+    '</div>'
+)
+
+# Single metric tile, styled by the .metric-card CSS class
+METRIC_CARD_TEMPLATE = (
+    '<div class="metric-card">'
+    '<small>{label}</small><br>'
+    '<strong style="font-size: 1.5rem;">{value}</strong>'
+    '</div>'
 )
 
-# Custom CSS
-st.markdown("""
+# Above this many feedback items, render a virtualized table instead of cards
+MAX_FEEDBACK_CARDS = 50
+
+
+@st.cache_resource
+def page_chrome_html() -> str:
+    """Custom CSS and page header, built once per server process"""
+    return """
 <style>
     .main-header {
         font-size: 3rem;
@@ -41,49 +104,210 @@ st.markdown("""
     .severity-medium { background-color: #fff8e1; border-left: 4px solid #ffc107; }
     .severity-low { background-color: #f1f8e9; border-left: 4px solid #4caf50; }
 </style>
-""", unsafe_allow_html=True)
+<h1 class="main-header">🔍 CodeCritic</h1>
+<p style="text-align: center; font-size: 1.2rem; color: #666;">AI-powered code review and analysis tool</p>
+"""
 
-# Header
-st.markdown('<h1 class="main-header">🔍 CodeCritic</h1>', unsafe_allow_html=True)
-st.markdown('<p style="text-align: center; font-size: 1.2rem; color: #666;">AI-powered code review and analysis tool</p>', unsafe_allow_html=True)
 
-# Sidebar configuration
-with st.sidebar:
-    st.header("⚙️ Configuration")
-    
-    # Check if API keys are available from environment
-    available_keys = []
-    if os.getenv("OPENAI_API_KEY"):
-        available_keys.append("OpenAI")
-    if os.getenv("ANTHROPIC_API_KEY"):
-        available_keys.append("Anthropic")
-    if os.getenv("GEMINI_API_KEY"):
-        available_keys.append("Gemini")
-    if os.getenv("MISTRAL_API_KEY"):
-        available_keys.append("Mistral")
-    
+@st.cache_resource
+def page_footer_html() -> str:
+    """Footer credits, built once per server process"""
+    return """
+<div style="text-align: center; color: #666; padding: 1rem;">
+    <p>🔍 CodeCritic v1.0.0 | Built with Streamlit</p>
+</div>
+"""
+
+
+@st.cache_resource
+def detect_providers() -> List[str]:
+    """LLM providers with API keys in the environment, checked once per process"""
+    providers = [
+        ("OpenAI", "OPENAI_API_KEY"),
+        ("Anthropic", "ANTHROPIC_API_KEY"),
+        ("Gemini", "GEMINI_API_KEY"),
+        ("Mistral", "MISTRAL_API_KEY")
+    ]
+    return [name for name, env_var in providers if os.getenv(env_var)]
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def decode_file(file_bytes: bytes) -> str:
+    """Decode uploaded file contents once per distinct upload"""
+    return file_bytes.decode('utf-8')
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def generate_review(code: str, language: str, model: str, modular: bool) -> Dict[str, Any]:
+    """Review a code snippet, reusing the result for identical inputs"""
+    start_time = time.time()
+
+    # Simulated analysis latency, off unless a demo delay is configured
+    if DEMO_DELAY:
+        time.sleep(DEMO_DELAY)
     
-    # Model selection
-    model = st.selectbox(
-        "Model",
-        [
-            "anthropic/claude-3-sonnet-20240229",
-            "anthropic/claude-3-haiku-20240307",
-            "gpt-4",
-            "gpt-3.5-turbo"
+    # Mock response
+    return {
+        "feedback": [
+            {
+                "type": "bug",
+                "message": "Function lacks error handling for edge cases",
+                "line_number": 1,
+                "function_name": "example_function",
+                "severity": "high",
+                "suggestion": "Add try-catch blocks for robust error handling",
+                "confidence": 0.9,
+                "tags": ["error-handling", "robustness"]
+            },
+            {
+                "type": "best_practice",
+                "message": "Consider adding type hints for better code documentation",
+                "line_number": 1,
+                "function_name": "example_function",
+                "severity": "low",
+                "suggestion": "Use typing module for type annotations",
+                "confidence": 0.8,
+                "tags": ["type-safety", "documentation"]
+            }
         ],
-        index=0
+        "summary": "Found 2 total issues: 🐞 1 potential bug(s), 💡 1 best practice suggestion(s)",
+        "total_issues": 2,
+        "processing_time": time.time() - start_time,
+        "model_used": model,
+        "modular_analysis": modular
+    }
+
+
+def code_html(text: str) -> str:
+    """Escaped inline <code> element"""
+    return f"<code>{html.escape(str(text))}</code>"
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def render_feedback_html(feedback: List[Dict[str, Any]]) -> str:
+    """Build the detailed feedback list as one pure-HTML block"""
+    feedback_blocks = []
+    for item in feedback:
+        severity = item.get("severity", "medium")
+        confidence = item.get("confidence", 0.8)
+
+        severity_color, severity_class = SEVERITY_STYLES.get(severity, DEFAULT_SEVERITY_STYLE)
+
+        parts = [
+            FEEDBACK_CARD_TEMPLATE.format_map({
+                "severity_class": severity_class,
+                "severity_color": severity_color,
+                "message": html.escape(item["message"]),
+                "confidence": confidence,
+                "severity": html.escape(severity.title())
+            })
+        ]
+
+        if item.get("function_name"):
+            parts.append(f"<p><em>Function: {code_html(item['function_name'])}</em></p>")
+
+        if item.get("suggestion"):
+            parts.append(f"<p><strong>💡 Suggestion:</strong> {html.escape(item['suggestion'])}</p>")
+
+        if item.get("tags"):
+            tags_str = ", ".join(code_html(tag) for tag in item["tags"])
+            parts.append(f"<p><strong>🏷️ Tags:</strong> {tags_str}</p>")
+
+        parts.append("<hr>")
+        feedback_blocks.append("\n".join(parts))
+
+    return "\n".join(feedback_blocks)
+
+
+def render_metric_cards(metrics: List[Tuple[str, str]]) -> str:
+    """Lay out (label, value) metric cards as one grid row of HTML"""
+    cards = "".join(
+        METRIC_CARD_TEMPLATE.format(label=html.escape(label), value=html.escape(value))
+        for label, value in metrics
     )
-    
-    # Language selection
-    language = st.selectbox(
-        "Programming Language",
-        ["python", "javascript", "typescript", "java", "cpp", "c", "csharp", "php", "ruby", "go", "rust"],
-        index=0
+    return (
+        f'<div style="display: grid; grid-template-columns: repeat({len(metrics)}, 1fr); gap: 1rem;">'
+        f'{cards}</div>'
     )
+
+
+async def analyze_file_async(file) -> Dict[str, Any]:
+    """Simulate analysis of a single uploaded file"""
+    # Simulated per-file latency, off unless a demo delay is configured
+    if DEMO_DELAY:
+        await asyncio.sleep(DEMO_DELAY)
+
+    line_count = file.getvalue().count(b'\n') + 1
+
+    return {
+        "filename": file.name,
+        "issues": line_count // 10,  # Mock issue count
+        "size_kb": file.size / 1024,
+        "language": file.name.split('.')[-1] if '.' in file.name else "unknown"
+    }
+
+
+async def analyze_files_async(files) -> List[Dict[str, Any]]:
+    """Analyze all files concurrently so total time tracks the slowest file"""
+    return await asyncio.gather(*(analyze_file_async(f) for f in files))
+
+# Configure page
+st.set_page_config(
+    page_title="CodeCritic - AI Code Review",
+    page_icon="🔍",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS and header
+st.markdown(page_chrome_html(), unsafe_allow_html=True)
+
+
+def render_sidebar():
+    """Render the configuration sidebar and return (api_key, model, language, enable_modular)"""
+    with st.sidebar:
+        st.header("⚙️ Configuration")
+        
+        # Check if API keys are available from environment
+        available_keys = detect_providers()
+        if available_keys:
+            api_key = "ENV_LOADED"
+        else:
+            api_key = st.text_input("API Key", type="password", key="api_key")
+        
+        # Settings apply together on submit instead of rerunning per widget
+        with st.form("config", border=False):
+            # Model selection
+            model = st.selectbox(
+                "Model",
+                MODELS,
+                index=0,
+                key="model"
+            )
+            
+            # Language selection
+            language = st.selectbox(
+                "Programming Language",
+                LANGUAGES,
+                index=0,
+                key="language"
+            )
+            
+            # Analysis options
+            enable_modular = st.checkbox(
+                "Modular Analysis",
+                value=True,
+                help="Analyze code function-by-function",
+                key="enable_modular"
+            )
+            
+            st.form_submit_button("Apply", use_container_width=True)
     
-    # Analysis options
-    
+    return api_key, model, language, enable_modular
+
+
+# Sidebar configuration
+api_key, model, language, enable_modular = render_sidebar()
 
 # Main content
 col1, col2 = st.columns([1, 1])
@@ -99,22 +323,7 @@ with col1:
     )
     
     if input_method == "📝 Paste Code":
-        # Language-specific placeholders
-        placeholders = {
-            "python": "def example_function():\n    # Your code here\n    return 'Hello, World!'",
-            "javascript": "function exampleFunction() {\n    // Your JavaScript code here\n    return 'Hello, World!';\n}",
-            "typescript": "function exampleFunction(): string {\n    // Your TypeScript code here\n    return 'Hello, World!';\n}",
-            "java": "public class Example {\n    public static void main(String[] args) {\n        // Your Java code here\n        System.out.println(\"Hello, World!\");\n    }\n}",
-            "cpp": "#include <iostream>\n\nint main() {\n    // Your C++ code here\n    std::cout << \"Hello, World!\" << std::endl;\n    return 0;\n}",
-            "c": "#include <stdio.h>\n\nint main() {\n    // Your C code here\n    printf(\"Hello, World!\\n\");\n    return 0;\n}",
-            "csharp": "using System;\n\nclass Program {\n    static void Main() {\n        // Your C# code here\n        Console.WriteLine(\"Hello, World!\");\n    }\n}",
-            "php": "<?php\n// Your PHP code here\nfunction exampleFunction() {\n    return 'Hello, World!';\n}\n?>",
-            "ruby": "# Your Ruby code here\ndef example_function\n  'Hello, World!'\nend",
-            "go": "package main\n\nimport \"fmt\"\n\nfunc main() {\n    // Your Go code here\n    fmt.Println(\"Hello, World!\")\n}",
-            "rust": "fn main() {\n    // Your Rust code here\n    println!(\"Hello, World!\");\n}"
-        }
-        
-        placeholder = placeholders.get(language, "// Your code here")
+        placeholder = PLACEHOLDERS.get(language, "// Your code here")
         
         # Single code input
         code_input = st.text_area(
@@ -136,16 +345,16 @@ with col1:
         
         if uploaded_files:
             # File selection dropdown
-            file_names = [f.name for f in uploaded_files]
+            files_by_name = {f.name: f for f in uploaded_files}
             selected_file = st.selectbox(
                 "Select file to analyze:",
-                file_names,
+                list(files_by_name),
                 help="Choose which file to analyze from your uploaded files"
             )
             
             # Display selected file content
-            selected_file_obj = next(f for f in uploaded_files if f.name == selected_file)
-            file_content = selected_file_obj.read().decode('utf-8')
+            selected_file_obj = files_by_name[selected_file]
+            file_content = decode_file(selected_file_obj.getvalue())
             code_input = st.text_area(
                 f"Content of {selected_file}:",
                 value=file_content,
@@ -169,39 +378,8 @@ with col1:
             else:
                 with st.spinner("Analyzing your code..."):
                     try:
-                        # Simulate analysis
-                        time.sleep(2)
-                        
-                        # Mock response
-                        mock_response = {
-                            "feedback": [
-                                {
-                                    "type": "bug",
-                                    "message": "Function lacks error handling for edge cases",
-                                    "line_number": 1,
-                                    "function_name": "example_function",
-                                    "severity": "high",
-                                    "suggestion": "Add try-catch blocks for robust error handling",
-                                    "confidence": 0.9,
-                                    "tags": ["error-handling", "robustness"]
-                                },
-                                {
-                                    "type": "best_practice",
-                                    "message": "Consider adding type hints for better code documentation",
-                                    "line_number": 1,
-                                    "function_name": "example_function",
-                                    "severity": "low",
-                                    "suggestion": "Use typing module for type annotations",
-                                    "confidence": 0.8,
-                                    "tags": ["type-safety", "documentation"]
-                                }
-                            ],
-                            "summary": "Found 2 total issues: 🐞 1 potential bug(s), 💡 1 best practice suggestion(s)",
-                            "total_issues": 2,
-                            "processing_time": 2.1,
-                            "model_used": model,
-                            "modular_analysis": enable_modular
-                        }
+                        # Simulate analysis (cached by code, language, model and options)
+                        mock_response = generate_review(code_input, language, model, enable_modular)
                         
                         # Add file information if multiple files were uploaded
                         if uploaded_files and selected_file:
@@ -222,34 +400,17 @@ with col1:
                 else:
                     with st.spinner(f"Analyzing {len(uploaded_files)} files..."):
                         try:
-                            # Simulate batch analysis
-                            time.sleep(len(uploaded_files) * 1.5)  # Simulate processing time
-                            
-                            # Mock batch response
-                            batch_results = []
-                            total_issues = 0
-                            
-                            for file in uploaded_files:
-                                file_content = file.read().decode('utf-8')
-                                file.seek(0)  # Reset file pointer
-                                
-                                # Simulate analysis for each file
-                                file_issues = len(file_content.split('\n')) // 10  # Mock issue count
-                                total_issues += file_issues
-                                
-                                batch_results.append({
-                                    "filename": file.name,
-                                    "issues": file_issues,
-                                    "size_kb": len(file_content) / 1024,
-                                    "language": file.name.split('.')[-1] if '.' in file.name else "unknown"
-                                })
+                            # Analyze all files concurrently
+                            start_time = time.time()
+                            batch_results = asyncio.run(analyze_files_async(uploaded_files))
+                            total_issues = sum(r["issues"] for r in batch_results)
                             
                             # Store batch results
                             st.session_state.batch_results = {
                                 "total_files": len(uploaded_files),
                                 "total_issues": total_issues,
                                 "files": batch_results,
-                                "processing_time": len(uploaded_files) * 1.5
+                                "processing_time": time.time() - start_time
                             }
                             
                             st.success(f"✅ Batch analysis complete! Analyzed {len(uploaded_files)} files with {total_issues} total issues.")
@@ -257,26 +418,22 @@ with col1:
                         except Exception as e:
                             st.error(f"Error during batch analysis: {str(e)}")
 
-with col2:
+
+@st.fragment
+def render_results():
+    """Render review and batch results; widgets here rerun only this pane"""
     st.header("🔍 Review Results")
     
     if 'review_result' in st.session_state:
         result = st.session_state.review_result
         
         # Summary metrics
-        col_metrics1, col_metrics2, col_metrics3, col_metrics4 = st.columns(4)
-        
-        with col_metrics1:
-            st.metric("Total Issues", result["total_issues"])
-        
-        with col_metrics2:
-            st.metric("Processing Time", f"{result['processing_time']:.1f}s")
-        
-        with col_metrics3:
-            st.metric("Model Used", result["model_used"].split("/")[-1])
-        
-        with col_metrics4:
-            st.metric("Modular Analysis", "✅" if result["modular_analysis"] else "❌")
+        st.html(render_metric_cards([
+            ("Total Issues", str(result["total_issues"])),
+            ("Processing Time", f"{result['processing_time']:.1f}s"),
+            ("Model Used", result["model_used"].split("/")[-1]),
+            ("Modular Analysis", "✅" if result["modular_analysis"] else "❌")
+        ]))
         
         # Summary
         st.markdown("### 📋 Summary")
@@ -285,37 +442,26 @@ with col2:
         # Detailed feedback
         st.markdown("### 📋 Detailed Feedback")
         
-        for item in result["feedback"]:
-            severity = item.get("severity", "medium")
-            confidence = item.get("confidence", 0.8)
-            
-            severity_color = {
-                "critical": "🔴",
-                "high": "🟠", 
-                "medium": "🟡",
-                "low": "🟢"
-            }.get(severity, "⚪")
-            
-            severity_class = f"severity-{severity}"
-            
-            st.markdown(f"""
-            <div class="{severity_class}" style="padding: 1rem; margin: 0.5rem 0; border-radius: 0.5rem;">
-                <strong>{severity_color} {item['message']}</strong><br>
-                <small>Confidence: {confidence:.1%} | Severity: {severity.title()}</small>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            if item.get("function_name"):
-                st.markdown(f"*Function: `{item['function_name']}`*")
-            
-            if item.get("suggestion"):
-                st.markdown(f"**💡 Suggestion:** {item['suggestion']}")
-            
-            if item.get("tags"):
-                tags_str = ", ".join([f"`{tag}`" for tag in item["tags"]])
-                st.markdown(f"**🏷️ Tags:** {tags_str}")
-            
-            st.markdown("---")
+        if len(result["feedback"]) > MAX_FEEDBACK_CARDS:
+            # Large reviews go into a grid that only draws the visible rows
+            st.dataframe(
+                [
+                    {
+                        "Severity": f"{SEVERITY_STYLES.get(item.get('severity', 'medium'), DEFAULT_SEVERITY_STYLE)[0]} {item.get('severity', 'medium').title()}",
+                        "Type": item.get("type", ""),
+                        "Message": item["message"],
+                        "Function": item.get("function_name") or "",
+                        "Suggestion": item.get("suggestion") or "",
+                        "Confidence": f"{item.get('confidence', 0.8):.0%}"
+                    }
+                    for item in result["feedback"]
+                ],
+                hide_index=True,
+                use_container_width=True
+            )
+        else:
+            # Rendered once per distinct feedback list and reused across reruns
+            st.html(render_feedback_html(result["feedback"]))
     else:
         st.info("👈 Enter your code and click 'Review Code' to get started!")
 
@@ -327,44 +473,39 @@ with col2:
         st.markdown("### 📁 Batch Analysis Results")
         
         # Batch summary metrics
-        col_batch1, col_batch2, col_batch3, col_batch4 = st.columns(4)
-        
-        with col_batch1:
-            st.metric("Files Analyzed", batch_result["total_files"])
-        
-        with col_batch2:
-            st.metric("Total Issues", batch_result["total_issues"])
-        
-        with col_batch3:
-            st.metric("Processing Time", f"{batch_result['processing_time']:.1f}s")
-        
-        with col_batch4:
-            avg_issues = batch_result["total_issues"] / batch_result["total_files"] if batch_result["total_files"] > 0 else 0
-            st.metric("Avg Issues/File", f"{avg_issues:.1f}")
+        avg_issues = batch_result["total_issues"] / batch_result["total_files"] if batch_result["total_files"] > 0 else 0
+        st.html(render_metric_cards([
+            ("Files Analyzed", str(batch_result["total_files"])),
+            ("Total Issues", str(batch_result["total_issues"])),
+            ("Processing Time", f"{batch_result['processing_time']:.1f}s"),
+            ("Avg Issues/File", f"{avg_issues:.1f}")
+        ]))
         
         # File-by-file breakdown
         st.markdown("### 📋 File-by-File Breakdown")
         
-        for file_result in batch_result["files"]:
-            with st.expander(f"📄 {file_result['filename']} ({file_result['language']}) - {file_result['issues']} issues"):
-                col_file1, col_file2, col_file3 = st.columns(3)
-                
-                with col_file1:
-                    st.metric("Issues", file_result["issues"])
-                
-                with col_file2:
-                    st.metric("Size", f"{file_result['size_kb']:.1f} KB")
-                
-                with col_file3:
-                    st.metric("Language", file_result["language"].upper())
-                
-                # Progress bar for issues
-                if file_result["issues"] > 0:
-                    st.progress(min(file_result["issues"] / 10, 1.0))  # Normalize to 0-1
-                    st.caption(f"Code quality score: {max(0, 10 - file_result['issues'])}/10")
-                else:
-                    st.success("✅ No issues found!")
-                    st.caption("Code quality score: 10/10")
+        st.dataframe(
+            [
+                {
+                    "File": file_result["filename"],
+                    "Language": file_result["language"].upper(),
+                    "Issues": file_result["issues"],
+                    "Size": file_result["size_kb"],
+                    "Quality Score": max(0, 10 - file_result["issues"])
+                }
+                for file_result in batch_result["files"]
+            ],
+            column_config={
+                "Size": st.column_config.NumberColumn(format="%.1f KB"),
+                "Quality Score": st.column_config.ProgressColumn(
+                    min_value=0,
+                    max_value=10,
+                    format="%d/10"
+                )
+            },
+            hide_index=True,
+            use_container_width=True
+        )
         
         # Overall quality assessment
         st.markdown("### 🎯 Overall Quality Assessment")
@@ -381,12 +522,12 @@ with col2:
         # Clear batch results button
         if st.button("🗑️ Clear Batch Results"):
             del st.session_state.batch_results
-            st.rerun()
+            st.rerun(scope="fragment")
+
+
+with col2:
+    render_results()
 
 # Footer
-st.markdown("---")
-st.markdown("""
-<div style="text-align: center; color: #666; padding: 1rem;">
-    <p>🔍 CodeCritic v1.0.0 | Built with Streamlit</p>
-</div>
-""", unsafe_allow_html=True)
+st.divider()
+st.html(page_footer_html())